@@ -7,26 +7,54 @@ mygeotab.api
 Public objects and methods wrapping the MyGeotab API.
 """
 
-from __future__ import unicode_literals
-
 import copy
+import functools
+import hashlib
+import json
+import operator
 import re
 import ssl
 import sys
+import threading
+import time
+from collections import UserList
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
 
 import requests
-import six
 from requests.adapters import HTTPAdapter
 from requests.exceptions import Timeout
 from requests.packages import urllib3
-from six.moves import UserList
-from six.moves.urllib.parse import urlparse
 
 from . import __title__, __version__
 from .exceptions import AuthenticationException, MyGeotabException, TimeoutException
-from .serializers import json_deserialize, json_serialize
+from .serializers import json_deserialize, json_serialize_bytes
 
 DEFAULT_TIMEOUT = 300
+UNDERSCORE_REGEX = re.compile(r"_(\w)")
+# The maximum number of pooled connections kept open to each server
+POOL_MAXSIZE = 16
+# MyGeotab calls are all POSTs, including ones that aren't safe to repeat (ie. 'Add'). They're only retried when the
+# call never ran: the connection failed, or the server was unavailable (503). Reads, 502 and 504 responses aren't
+# retried, as the server may have run the call (and timeouts would be multiplied).
+DEFAULT_RETRY = urllib3.util.Retry(
+    total=3,
+    read=0,
+    backoff_factor=0.3,
+    status_forcelist=(503,),
+    allowed_methods=frozenset({"POST"}),
+    raise_on_status=False,
+)
+# Methods which change entities, and so invalidate any cached results for their type
+WRITE_METHODS = ("Add", "Set", "Remove")
+# Pre-encoded JSON-RPC request bodies, up to the parameters, for the most frequently called methods
+JSON_RPC_ENVELOPES = {
+    method: '{{"id":-1,"method":"{}","params":'.format(method).encode("utf-8")
+    for method in ("Get", "GetFeed", "GetCountOf", "Add", "Set", "Remove", "ExecuteMultiCall")
+}
+
+_default_session = None
+_default_session_lock = threading.Lock()
 
 
 class API(object):
@@ -34,7 +62,14 @@ class API(object):
     """
 
     def __init__(
-        self, username, password=None, database=None, session_id=None, server="my.geotab.com", timeout=DEFAULT_TIMEOUT
+        self,
+        username,
+        password=None,
+        database=None,
+        session_id=None,
+        server="my.geotab.com",
+        timeout=DEFAULT_TIMEOUT,
+        cache=None,
     ):
         """Initialize the MyGeotab API object with credentials.
 
@@ -50,6 +85,9 @@ class API(object):
         :type server: str or None
         :param timeout: The timeout to make the call, in seconds. By default, this is 300 seconds (or 5 minutes).
         :type timeout: float or None
+        :param cache: A dict-like object (ie. a dict or a `diskcache.Cache`) to cache the results of 'Get' calls in.
+                      Optional. Only calls made with a `cache_ttl` are cached.
+        :type cache: dict or None
         :raise Exception: Raises an Exception if a username, or one of the session_id or password is not provided.
         """
         if username is None:
@@ -60,7 +98,33 @@ class API(object):
             username=username, session_id=session_id, database=database, server=server, password=password
         )
         self.timeout = timeout
+        self.cache = cache
+        self._session = _create_session()
+        self._endpoint_server = None
+        self._api_endpoint = None
+        self._verify_ssl = True
         self.__reauthorize_count = 0
+        self.__reauthorize_lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_API__reauthorize_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__reauthorize_lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Closes the underlying HTTP session and any pooled connections to the server.
+        """
+        self._session.close()
 
     @property
     def _server(self):
@@ -75,13 +139,35 @@ class API(object):
         :rtype: bool
         :return: True if the calls are being made locally.
         """
-        return not any(s in get_api_url(self._server) for s in ["127.0.0.1", "localhost"])
+        self._update_endpoint()
+        return self._verify_ssl
+
+    @property
+    def _endpoint(self):
+        """The API endpoint URL for the current server.
 
-    def call(self, method, **parameters):
+        :rtype: str
+        """
+        self._update_endpoint()
+        return self._api_endpoint
+
+    def _update_endpoint(self):
+        """Caches the API endpoint URL and whether or not SSL should be verified, until the server changes.
+        """
+        server = self._server
+        if server != self._endpoint_server:
+            self._api_endpoint = get_api_url(server)
+            self._verify_ssl = not any(s in self._api_endpoint for s in ["127.0.0.1", "localhost"])
+            self._endpoint_server = server
+
+    def call(self, method, cache_ttl=None, **parameters):
         """Makes a call to the API.
 
         :param method: The method name.
         :type method: str
+        :param cache_ttl: If set and the API has a cache, the results of a 'Get' call are cached (or read from the
+                          cache) for this number of seconds. By default, results aren't cached.
+        :type cache_ttl: float or None
         :param parameters: Additional parameters to send (for example, search=dict(id='b123') ).
         :raise MyGeotabException: Raises when an exception occurs on the MyGeotab server.
         :raise TimeoutException: Raises when the request does not respond after some time.
@@ -91,27 +177,58 @@ class API(object):
         if method is None:
             raise Exception("A method name must be specified")
         params = process_parameters(parameters)
+        cache_key, result = self._get_cached_result(method, params, cache_ttl)
+        if result is not None:
+            return result
         if self.credentials and not self.credentials.session_id:
             self.authenticate()
         if "credentials" not in params and self.credentials.session_id:
-            params["credentials"] = self.credentials.get_param()
+            params = dict(params, credentials=self.credentials.get_param())
+        session_id = self.credentials.session_id
 
         try:
-            result = _query(self._server, method, params, self.timeout, verify_ssl=self._is_verify_ssl)
+            result = _query(
+                self._server,
+                method,
+                params,
+                self.timeout,
+                verify_ssl=self._is_verify_ssl,
+                session=self._session,
+                api_endpoint=self._endpoint,
+            )
             if result is not None:
                 self.__reauthorize_count = 0
+            self._cache_result(cache_key, result, cache_ttl)
             return result
         except MyGeotabException as exception:
             if exception.name == "InvalidUserException":
-                if self.__reauthorize_count == 0 and self.credentials.password:
-                    self.__reauthorize_count += 1
-                    self.authenticate()
-                    return self.call(method, **parameters)
+                if self._reauthorize(session_id):
+                    return self.call(method, cache_ttl=cache_ttl, **parameters)
                 else:
                     raise AuthenticationException(
                         self.credentials.username, self.credentials.database, self.credentials.server
                     )
             raise
+        finally:
+            self._invalidate_written_types(method, params)
+
+    def _reauthorize(self, session_id):
+        """Re-authenticates after a call made with the given session was rejected. Only one thread re-authenticates
+        at a time, and calls from other threads rejected with the same expired session are retried with the new one.
+
+        :param session_id: The session ID the rejected call was made with.
+        :type session_id: str
+        :return: True if the call should be retried with the current session.
+        :rtype: bool
+        """
+        with self.__reauthorize_lock:
+            if self.credentials.session_id != session_id:
+                return True
+            if self.__reauthorize_count != 0 or not self.credentials.password:
+                return False
+            self.__reauthorize_count += 1
+            self.authenticate()
+            return True
 
     def multi_call(self, calls):
         """Performs a multi-call to the API.
@@ -124,14 +241,46 @@ class API(object):
         :return: The results from the server.
         :rtype: list
         """
-        formatted_calls = [dict(method=call[0], params=call[1] if len(call) > 1 else {}) for call in calls]
+        formatted_calls = [{"method": call[0], "params": call[1] if len(call) > 1 else {}} for call in calls]
         return self.call("ExecuteMultiCall", calls=formatted_calls)
 
-    def get(self, type_name, **parameters):
+    def parallel_multi_call(self, calls, max_workers=10, chunk_size=None):
+        """Performs the calls concurrently, as separate requests, instead of as a single multi-call.
+
+        The requests are made from a pool of threads sharing this object's pooled connections. As the threads
+        spend most of their time waiting on the server (which releases the GIL), independent calls (ie. several
+        'Get' calls) complete in roughly the time of the slowest one.
+
+        :param calls: A list of call 2-tuples with method name and params
+                      (for example, ('Get', dict(typeName='Trip')) ).
+        :type calls: list((str, dict))
+        :param max_workers: The maximum number of requests to make at the same time, up to the number of pooled
+                            connections per server (`POOL_MAXSIZE`).
+        :type max_workers: int
+        :param chunk_size: If set, the calls are grouped into multi-calls of up to this many calls each.
+        :type chunk_size: int or None
+        :raise MyGeotabException: Raises when an exception occurs on the MyGeotab server.
+        :raise TimeoutException: Raises when the request does not respond after some time.
+        :return: The results from the server, in the same order as the calls.
+        :rtype: list
+        """
+        if self.credentials and not self.credentials.session_id:
+            self.authenticate()
+        with ThreadPoolExecutor(max_workers=min(max_workers, POOL_MAXSIZE)) as executor:
+            if chunk_size:
+                chunks = [calls[slice(i, i + chunk_size)] for i in range(0, len(calls), chunk_size)]
+                futures = [executor.submit(self.multi_call, chunk) for chunk in chunks]
+                return [result for future in futures for result in future.result()]
+            futures = [executor.submit(self.call, call[0], **(call[1] if len(call) > 1 else {})) for call in calls]
+            return [future.result() for future in futures]
+
+    def get(self, type_name, cache_ttl=None, **parameters):
         """Gets entities using the API. Shortcut for using call() with the 'Get' method.
 
         :param type_name: The type of entity.
         :type type_name: str
+        :param cache_ttl: If set and the API has a cache, the results are cached for this number of seconds.
+        :type cache_ttl: float or None
         :param parameters: Additional parameters to send.
         :raise MyGeotabException: Raises when an exception occurs on the MyGeotab server.
         :raise TimeoutException: Raises when the request does not respond after some time.
@@ -145,7 +294,7 @@ class API(object):
             if "search" in parameters:
                 parameters.update(parameters["search"])
             parameters = dict(search=parameters, resultsLimit=results_limit)
-        return EntityList(self.call("Get", type_name=type_name, **parameters), type_name=type_name)
+        return EntityList(self.call("Get", cache_ttl=cache_ttl, type_name=type_name, **parameters), type_name=type_name)
 
     def add(self, type_name, entity):
         """Adds an entity using the API. Shortcut for using call() with the 'Add' method.
@@ -185,6 +334,23 @@ class API(object):
         """
         return self.call("Remove", type_name=type_name, entity=entity)
 
+    def invalidate(self, type_name=None):
+        """Removes cached 'Get' results from the cache. Called automatically by calls which add, set or remove entities.
+
+        :param type_name: The type of entity to remove the cached results for. If None, the whole cache is cleared.
+        :type type_name: str or None
+        """
+        if self.cache is None:
+            return
+        if type_name is None:
+            self.cache.clear()
+            return
+        prefix = type_name + ":"
+        # Other threads may be caching results while the keys are being removed
+        for key in list(self.cache):
+            if isinstance(key, str) and key.startswith(prefix):
+                self.cache.pop(key, None)
+
     def authenticate(self, is_global=True):
         """Authenticates against the API server.
 
@@ -200,7 +366,15 @@ class API(object):
         )
         auth_data["global"] = is_global
         try:
-            result = _query(self._server, "Authenticate", auth_data, self.timeout, verify_ssl=self._is_verify_ssl)
+            result = _query(
+                self._server,
+                "Authenticate",
+                auth_data,
+                self.timeout,
+                verify_ssl=self._is_verify_ssl,
+                session=self._session,
+                api_endpoint=self._endpoint,
+            )
             if result:
                 new_server = result["path"]
                 server = self.credentials.server
@@ -218,6 +392,62 @@ class API(object):
                 )
             raise
 
+    def _get_cached_result(self, method, params, cache_ttl):
+        """Gets the cached results of a call, if it is a 'Get' call which opted in to caching.
+
+        :param method: The method name.
+        :type method: str
+        :param params: The processed parameters of the call.
+        :type params: dict
+        :param cache_ttl: The number of seconds to cache the results for. If None, the call isn't cached.
+        :type cache_ttl: float or None
+        :return: The cache key (None if the call isn't cached) and the cached results (None if there are none).
+        :rtype: tuple
+        """
+        if self.cache is None or cache_ttl is None or method != "Get":
+            return None, None
+        cache_key = _get_cache_key(self.credentials, method, params)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            expires, result = cached
+            if expires > time.time():
+                return cache_key, copy.deepcopy(result)
+            self.cache.pop(cache_key, None)
+        return cache_key, None
+
+    def _cache_result(self, cache_key, result, cache_ttl):
+        """Caches the results of a call. Caches with a `set` method accepting an `expire` time (ie. a
+        `diskcache.Cache`) also remove the results themselves once they expire.
+
+        :param cache_key: The cache key of the call. If None, the call isn't cached.
+        :type cache_key: str or None
+        :param result: The results from the server. If None, nothing is cached.
+        :param cache_ttl: The number of seconds to cache the results for.
+        :type cache_ttl: float
+        """
+        if cache_key is None or result is None:
+            return
+        cached = (time.time() + cache_ttl, copy.deepcopy(result))
+        if hasattr(self.cache, "set"):
+            self.cache.set(cache_key, cached, expire=cache_ttl)
+        else:
+            self.cache[cache_key] = cached
+
+    def _invalidate_written_types(self, method, params):
+        """Removes the cached results for the types of entities that a call (or multi-call) adds, sets or removes.
+
+        :param method: The method name.
+        :type method: str
+        :param params: The processed parameters of the call.
+        :type params: dict
+        """
+        if self.cache is None:
+            return
+        calls = params.get("calls", []) if method == "ExecuteMultiCall" else [{"method": method, "params": params}]
+        for call in calls:
+            if call.get("method") in WRITE_METHODS:
+                self.invalidate((call.get("params") or {}).get("typeName"))
+
     @staticmethod
     def from_credentials(credentials):
         """Returns a new API object from an existing Credentials object.
@@ -240,6 +470,9 @@ class EntityList(UserList):
     """The customized result list
     """
 
+    #: The maximum number of entities to show when pretty printing the list in IPython.
+    pretty_limit = 50
+
     def __init__(self, data, type_name):
         """Gets entities using the API. Shortcut for using call() with the 'Get' method.
 
@@ -251,6 +484,21 @@ class EntityList(UserList):
         super(EntityList, self).__init__(data)
         self.type_name = type_name
 
+    @classmethod
+    def _from_data(cls, data, type_name):
+        """Creates an EntityList which takes ownership of an already-built list, without copying it.
+
+        :param data: The newly created list of result data.
+        :type data: list
+        :param type_name: The type of entity.
+        :type type_name: str
+        :rtype: EntityList
+        """
+        inst = cls.__new__(cls)
+        inst.data = data
+        inst.type_name = type_name
+        return inst
+
     def _repr_pretty_(self, p, cycle):
         """The pretty printer for IPython
         """
@@ -258,39 +506,39 @@ class EntityList(UserList):
             p.text("{}(...)".format(self.type_name))
         else:
             with p.group(8, "{}([".format(self.type_name), "])"):
-                for idx, item in enumerate(self.data):
+                for idx, item in enumerate(self.data[: self.pretty_limit]):
                     if idx:
                         p.text(",")
                         p.breakable()
                     p.pretty(item)
+                remaining = len(self.data) - self.pretty_limit
+                if remaining > 0:
+                    p.text(",")
+                    p.breakable()
+                    p.text("...{} more".format(remaining))
 
     def __getitem__(self, i):
         if isinstance(i, slice):
-            return self.__class__(self.data[i], self.type_name)
+            return self._from_data(self.data[i], self.type_name)
         else:
             return self.data[i]
 
-    def __getslice__(self, i, j):
-        i = max(i, 0)
-        j = max(j, 0)
-        return self.__class__(self.data[i:j], self.type_name)
-
     def __add__(self, other):
         if isinstance(other, UserList):
-            return self.__class__(self.data + other.data, self.type_name)
+            return self._from_data(self.data + other.data, self.type_name)
         elif isinstance(other, type(self.data)):
-            return self.__class__(self.data + other, self.type_name)
-        return self.__class__(self.data + list(other), self.type_name)
+            return self._from_data(self.data + other, self.type_name)
+        return self._from_data(self.data + list(other), self.type_name)
 
     def __radd__(self, other):
         if isinstance(other, UserList):
-            return self.__class__(other.data + self.data, self.type_name)
+            return self._from_data(other.data + self.data, self.type_name)
         elif isinstance(other, type(self.data)):
-            return self.__class__(other + self.data, self.type_name)
-        return self.__class__(list(other) + self.data, self.type_name)
+            return self._from_data(other + self.data, self.type_name)
+        return self._from_data(list(other) + self.data, self.type_name)
 
     def __mul__(self, n):
-        return self.__class__(self.data * n, self.type_name)
+        return self._from_data(self.data * n, self.type_name)
 
     __rmul__ = __mul__
 
@@ -311,13 +559,14 @@ class EntityList(UserList):
         :rtype: EntityList
         """
 
-        def sort_by_key(entity):
-            prop = entity[key]
-            if isinstance(prop, six.string_types):
-                return prop.lower()
-            return prop
+        if self.data and isinstance(self.data[0][key], str):
+
+            def sort_by_key(entity):
+                return entity[key].lower()
 
-        return self.__class__(sorted(self.data, key=sort_by_key, reverse=reverse), type_name=self.type_name)
+        else:
+            sort_by_key = operator.itemgetter(key)
+        return self._from_data(sorted(self.data, key=sort_by_key, reverse=reverse), self.type_name)
 
     @property
     def first(self):
@@ -357,10 +606,8 @@ class EntityList(UserList):
         except ImportError:
             raise ImportError("The 'pandas' package could not be imported")
         if normalize:
-            from pandas.io.json import json_normalize
-
-            return json_normalize(self.data)
-        return pandas.DataFrame.from_dict(self.data)
+            return pandas.json_normalize(self.data)
+        return pandas.DataFrame.from_records(self.data)
 
 
 class Credentials(object):
@@ -405,16 +652,45 @@ class Credentials(object):
 
 
 class GeotabHTTPAdapter(HTTPAdapter):
-    """HTTP adapter to force use of TLS 1.2 for HTTPS connections.
+    """HTTP adapter to require TLS 1.2 or newer for HTTPS connections.
     """
 
     def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
-        self.poolmanager = urllib3.poolmanager.PoolManager(
-            num_pools=connections, maxsize=maxsize, block=block, ssl_version=ssl.PROTOCOL_TLSv1_2, **pool_kwargs
-        )
+        pool_kwargs.setdefault("ssl_minimum_version", ssl.TLSVersion.TLSv1_2)
+        super(GeotabHTTPAdapter, self).init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
 
 
-def _query(server, method, parameters, timeout=DEFAULT_TIMEOUT, verify_ssl=True):
+def _create_session():
+    """Creates an HTTP session with pooled, keep-alive connections to the MyGeotab servers.
+
+    Failed connections and 503 responses are retried with an exponential backoff (see `DEFAULT_RETRY`).
+
+    :return: The configured session.
+    :rtype: requests.Session
+    """
+    session = requests.Session()
+    session.mount(
+        "https://", GeotabHTTPAdapter(pool_connections=4, pool_maxsize=POOL_MAXSIZE, max_retries=DEFAULT_RETRY)
+    )
+    session.headers.update(get_headers())
+    return session
+
+
+def _get_default_session():
+    """Gets the shared session used for calls made outside of an API object (ie. `server_call`).
+
+    :return: The shared session.
+    :rtype: requests.Session
+    """
+    global _default_session
+    if _default_session is None:
+        with _default_session_lock:
+            if _default_session is None:
+                _default_session = _create_session()
+    return _default_session
+
+
+def _query(server, method, parameters, timeout=DEFAULT_TIMEOUT, verify_ssl=True, session=None, api_endpoint=None):
     """Formats and performs the query against the API.
 
     :param server: The MyGeotab server.
@@ -427,32 +703,34 @@ def _query(server, method, parameters, timeout=DEFAULT_TIMEOUT, verify_ssl=True)
     :type timeout: float
     :param verify_ssl: If True, verify the SSL certificate. It's recommended not to modify this.
     :type verify_ssl: bool
+    :param session: The session to make the request with. If None, a shared session is used.
+    :type session: requests.Session or None
+    :param api_endpoint: The API endpoint URL for the server. If None, it is resolved from the server.
+    :type api_endpoint: str or None
     :raise MyGeotabException: Raises when an exception occurs on the MyGeotab server.
     :raise TimeoutException: Raises when the request does not respond after some time.
-    :raise urllib2.HTTPError: Raises when there is an HTTP status code that indicates failure.
+    :raise requests.HTTPError: Raises when there is an HTTP status code that indicates failure.
     :return: The JSON-decoded result from the server.
     """
-    api_endpoint = get_api_url(server)
-    params = dict(id=-1, method=method, params=parameters or {})
-    headers = get_headers()
-    with requests.Session() as session:
-        session.mount("https://", GeotabHTTPAdapter())
-        try:
-            response = session.post(
-                api_endpoint,
-                data=json_serialize(params),
-                headers=headers,
-                allow_redirects=True,
-                timeout=timeout,
-                verify=verify_ssl,
-            )
-        except Timeout:
-            raise TimeoutException(server)
+    if api_endpoint is None:
+        api_endpoint = get_api_url(server)
+    envelope = JSON_RPC_ENVELOPES.get(method)
+    if envelope is not None:
+        data = envelope + json_serialize_bytes(parameters or {}) + b"}"
+    else:
+        data = json_serialize_bytes(dict(id=-1, method=method, params=parameters or {}))
+    if session is None:
+        session = _get_default_session()
+    try:
+        response = session.post(api_endpoint, data=data, allow_redirects=True, timeout=timeout, verify=verify_ssl)
+    except Timeout:
+        raise TimeoutException(server)
     response.raise_for_status()
-    content_type = response.headers.get("Content-Type")
-    if content_type and "application/json" not in content_type.lower():
-        return response.text
-    return _process(json_deserialize(response.text))
+    content_type = response.headers.get("Content-Type", "")
+    if content_type and not content_type.startswith("application/json"):
+        if "application/json" not in content_type.lower():
+            return response.text
+    return _process(json_deserialize(response.content))
 
 
 def _process(data):
@@ -504,18 +782,57 @@ def process_parameters(parameters):
     """
     if not parameters:
         return {}
-    params = copy.copy(parameters)
-    for param_name in parameters:
-        value = parameters[param_name]
-        server_param_name = re.sub(r"_(\w)", lambda m: m.group(1).upper(), param_name)
-        if isinstance(value, dict):
-            value = process_parameters(value)
-        params[server_param_name] = value
-        if server_param_name != param_name:
-            del params[param_name]
-    return params
+    if not any("_" in param_name or isinstance(value, dict) for param_name, value in parameters.items()):
+        return parameters
+    params = {}
+    has_renamed = False
+    stack = [(parameters, params)]
+    while stack:
+        source, target = stack.pop()
+        for param_name, value in source.items():
+            if "_" in param_name:
+                param_name = _to_camel_case(param_name)
+                has_renamed = True
+            if isinstance(value, dict):
+                nested_params = {}
+                stack.append((value, nested_params))
+                value = nested_params
+            target[param_name] = value
+    return params if has_renamed else parameters
+
+
+@functools.lru_cache(maxsize=1024)
+def _to_camel_case(name):
+    """Converts a Pythonic-style parameter name with underscores into a camel-case name.
+
+    :param name: The parameter name.
+    :type name: str
+    :return: The camel-case parameter name.
+    :rtype: str
+    """
+    return UNDERSCORE_REGEX.sub(lambda m: m.group(1).upper(), name)
+
+
+def _get_cache_key(credentials, method, parameters):
+    """Gets the key to cache the results of a call with, scoped to the database and user.
+
+    :param credentials: The credentials the call is made with.
+    :type credentials: Credentials
+    :param method: The method name.
+    :type method: str
+    :param parameters: The processed parameters of the call.
+    :type parameters: dict
+    :return: The cache key, prefixed by the type name.
+    :rtype: str
+    """
+    call_params = {name: value for name, value in parameters.items() if name != "credentials"}
+    key_data = json.dumps(
+        [credentials.database, credentials.username, method, call_params], sort_keys=True, default=str
+    ).encode("utf-8")
+    return "{}:{}".format(parameters.get("typeName"), hashlib.sha256(key_data).hexdigest())
 
 
+@functools.lru_cache(maxsize=64)
 def get_api_url(server):
     """Formats the server URL properly in order to query the API.
 
@@ -524,7 +841,6 @@ def get_api_url(server):
     """
     parsed = urlparse(server)
     base_url = parsed.netloc if parsed.netloc else parsed.path
-    base_url.replace("/", "")
     return "https://" + base_url + "/apiv1"
 
 
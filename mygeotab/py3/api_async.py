@@ -4,13 +4,9 @@
 mygeotab.py3.api_async
 ~~~~~~~~~~~~~~~~~~~~~~
 
-Async/Await-able (Python 3.5+) public objects and methods wrapping the MyGeotab API.
+Async/Await-able public objects and methods wrapping the MyGeotab API.
 """
 
-import sys
-
-if sys.version_info < (3, 5):
-    raise Exception("Python 3.5+ is required to use the async API")
 import ssl
 from concurrent.futures import TimeoutError
 
@@ -27,7 +23,14 @@ class API(api.API):
     """
 
     def __init__(
-        self, username, password=None, database=None, session_id=None, server="my.geotab.com", timeout=DEFAULT_TIMEOUT
+        self,
+        username,
+        password=None,
+        database=None,
+        session_id=None,
+        server="my.geotab.com",
+        timeout=DEFAULT_TIMEOUT,
+        cache=None,
     ):
         """
         Initialize the asynchronous MyGeotab API object with credentials.
@@ -38,14 +41,18 @@ class API(api.API):
         :param session_id: A session ID, assigned by the server.
         :param server: The server ie. my23.geotab.com. Optional as this usually gets resolved upon authentication.
         :param timeout: The timeout to make the call, in seconds. By default, this is 300 seconds (or 5 minutes).
+        :param cache: A dict-like object (ie. a dict or a `diskcache.Cache`) to cache the results of 'Get' calls in.
+                      Only calls made with a `cache_ttl` are cached.
         :raise Exception: Raises an Exception if a username, or one of the session_id or password is not provided.
         """
-        super().__init__(username, password, database, session_id, server, timeout)
+        super().__init__(username, password, database, session_id, server, timeout, cache)
 
-    async def call_async(self, method, **parameters):
+    async def call_async(self, method, cache_ttl=None, **parameters):
         """Makes an async call to the API.
 
         :param method: The method name.
+        :param cache_ttl: If set and the API has a cache, the results of a 'Get' call are cached (or read from the
+                          cache) for this number of seconds. By default, results aren't cached.
         :param params: Additional parameters to send (for example, search=dict(id='b123') )
         :return: The JSON result (decoded into a dict) from the server.abs
         :raise MyGeotabException: Raises when an exception occurs on the MyGeotab server.
@@ -54,27 +61,32 @@ class API(api.API):
         if method is None:
             raise Exception("A method name must be specified")
         params = api.process_parameters(parameters)
+        cache_key, result = self._get_cached_result(method, params, cache_ttl)
+        if result is not None:
+            return result
         if self.credentials and not self.credentials.session_id:
             self.authenticate()
         if "credentials" not in params and self.credentials.session_id:
-            params["credentials"] = self.credentials.get_param()
+            params = dict(params, credentials=self.credentials.get_param())
+        session_id = self.credentials.session_id
 
         try:
             result = await _query(self._server, method, params, verify_ssl=self._is_verify_ssl)
             if result is not None:
                 self.__reauthorize_count = 0
+            self._cache_result(cache_key, result, cache_ttl)
             return result
         except MyGeotabException as exception:
             if exception.name == "InvalidUserException":
-                if self.__reauthorize_count == 0 and self.credentials.password:
-                    self.__reauthorize_count += 1
-                    self.authenticate()
-                    return await self.call_async(method, **parameters)
+                if self._reauthorize(session_id):
+                    return await self.call_async(method, cache_ttl=cache_ttl, **parameters)
                 else:
                     raise AuthenticationException(
                         self.credentials.username, self.credentials.database, self.credentials.server
                     )
             raise
+        finally:
+            self._invalidate_written_types(method, params)
 
     async def multi_call_async(self, calls):
         """Performs an async multi-call to the API
@@ -84,13 +96,14 @@ class API(api.API):
         :raise MyGeotabException: Raises when an exception occurs on the MyGeotab server
         :raise TimeoutException: Raises when the request does not respond after some time.
         """
-        formatted_calls = [dict(method=call[0], params=call[1] if len(call) > 1 else {}) for call in calls]
+        formatted_calls = [{"method": call[0], "params": call[1] if len(call) > 1 else {}} for call in calls]
         return await self.call_async("ExecuteMultiCall", calls=formatted_calls)
 
-    async def get_async(self, type_name, **parameters):
+    async def get_async(self, type_name, cache_ttl=None, **parameters):
         """Gets entities asynchronously using the API. Shortcut for using async_call() with the 'Get' method.
 
         :param type_name: The type of entity.
+        :param cache_ttl: If set and the API has a cache, the results are cached for this number of seconds.
         :param parameters: Additional parameters to send.
         :return: The JSON result (decoded into a dict) from the server.
         :raise MyGeotabException: Raises when an exception occurs on the MyGeotab server.
@@ -103,7 +116,7 @@ class API(api.API):
             if "search" in parameters:
                 parameters.update(parameters["search"])
             parameters = dict(search=parameters, resultsLimit=results_limit)
-        return await self.call_async("Get", type_name=type_name, **parameters)
+        return await self.call_async("Get", cache_ttl=cache_ttl, type_name=type_name, **parameters)
 
     async def add_async(self, type_name, entity):
         """
@@ -172,6 +185,17 @@ async def server_call_async(method, server, timeout=DEFAULT_TIMEOUT, verify_ssl=
     return await _query(server, method, parameters, timeout=timeout, verify_ssl=verify_ssl)
 
 
+def _create_ssl_context():
+    """Creates an SSL context which verifies certificates and requires TLS 1.2 or newer.
+
+    :return: The SSL context.
+    :rtype: ssl.SSLContext
+    """
+    context = ssl.create_default_context()
+    context.minimum_version = ssl.TLSVersion.TLSv1_2
+    return context
+
+
 async def _query(server, method, parameters, timeout=DEFAULT_TIMEOUT, verify_ssl=True):
     """Formats and performs the asynchronous query against the API
 
@@ -188,7 +212,7 @@ async def _query(server, method, parameters, timeout=DEFAULT_TIMEOUT, verify_ssl
     api_endpoint = api.get_api_url(server)
     params = dict(id=-1, method=method, params=parameters)
     headers = get_headers()
-    conn = aiohttp.TCPConnector(ssl=ssl.SSLContext(ssl.PROTOCOL_TLSv1_2) if verify_ssl else False)
+    conn = aiohttp.TCPConnector(ssl=_create_ssl_context() if verify_ssl else False)
     try:
         async with aiohttp.ClientSession(connector=conn) as session:
             response = await session.post(
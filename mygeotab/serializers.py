@@ -8,10 +8,19 @@ JSON serialization and deserialization helper objects for the MyGeotab API.
 """
 
 import re
+from datetime import datetime
 
 import arrow
-import six
 
+use_orjson = False
+try:
+    import orjson
+
+    ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+    use_orjson = True
+except ImportError:
+    pass
 use_rapidjson = False
 try:
     import rapidjson
@@ -26,15 +35,40 @@ import json
 from mygeotab import dates
 
 DATETIME_REGEX = re.compile(r"^\d{4}\-\d{2}\-\d{2}")
+# The date formats sent by MyGeotab servers, which datetime.fromisoformat() parses the same way as arrow
+ISO_DATETIME_REGEX = re.compile(r"^\d{4}-\d{2}-\d{2}(T\d{2}:\d{2}:\d{2}(\.\d{3}|\.\d{6})?(Z|[+-]\d{2}:\d{2})?)?$")
 
 
 def json_serialize(obj):
+    if use_orjson:
+        return json_serialize_bytes(obj).decode("utf-8")
+    return _json_serialize(obj)
+
+
+def json_serialize_bytes(obj):
+    if use_orjson:
+        try:
+            return orjson.dumps(obj, default=object_serializer, option=ORJSON_OPTIONS)
+        except TypeError:
+            # orjson can't serialize integers outside of the 64-bit range
+            pass
+    return _json_serialize(obj).encode("utf-8")
+
+
+def _json_serialize(obj):
     if use_rapidjson:
         return rapidjson.dumps(obj, default=object_serializer)
     return json.dumps(obj, default=object_serializer, separators=(",", ":"))
 
 
 def json_deserialize(json_str):
+    """Deserializes a JSON document, converting any date strings into datetime objects.
+
+    :param json_str: The JSON document, either as a string or as UTF-8 encoded bytes.
+    :type json_str: str or bytes
+    """
+    if use_orjson:
+        return _deserialize_objects(orjson.loads(json_str))
     if use_rapidjson:
         return rapidjson.loads(json_str, datetime_mode=DATETIME_MODE)
     return json.loads(json_str, object_hook=object_deserializer)
@@ -48,15 +82,50 @@ def object_serializer(obj):
     return dates.format_iso_datetime(obj) if hasattr(obj, "isoformat") else obj
 
 
+def _deserialize_objects(data):
+    """Converts the date strings in every dict of an already-parsed JSON document into datetime objects.
+
+    :param data: The parsed JSON data.
+    """
+    if not isinstance(data, (dict, list)):
+        return data
+    containers = [data]
+    while containers:
+        container = containers.pop()
+        if isinstance(container, dict):
+            for key, val in container.items():
+                if isinstance(val, str):
+                    if DATETIME_REGEX.match(val):
+                        container[key] = _deserialize_datetime(val)
+                elif isinstance(val, (dict, list)):
+                    containers.append(val)
+        else:
+            containers.extend(item for item in container if isinstance(item, (dict, list)))
+    return data
+
+
+def _deserialize_datetime(val):
+    """Parses a date string into a UTC datetime, falling back to the string if it isn't a valid date.
+
+    :param val: The date string.
+    """
+    if ISO_DATETIME_REGEX.match(val):
+        try:
+            return dates.localize_datetime(datetime.fromisoformat(val[:-1] + "+00:00" if val[-1] == "Z" else val))
+        except ValueError:
+            pass
+    try:
+        return dates.localize_datetime(arrow.get(val).datetime)
+    except (ValueError, arrow.parser.ParserError):
+        return val
+
+
 def object_deserializer(obj):
     """Helper to deserialize a raw result dict into a proper dict.
 
     :param obj: The dict.
     """
     for key, val in obj.items():
-        if isinstance(val, six.string_types) and DATETIME_REGEX.search(val):
-            try:
-                obj[key] = dates.localize_datetime(arrow.get(val).datetime)
-            except (ValueError, arrow.parser.ParserError):
-                obj[key] = val
+        if isinstance(val, str) and DATETIME_REGEX.match(val):
+            obj[key] = _deserialize_datetime(val)
     return obj
@@ -2,7 +2,6 @@
 
 import ast
 import re
-import sys
 
 from setuptools import setup
 
@@ -20,15 +19,7 @@ except IOError:
     readme = ""
     changelog = ""
 
-py_version = sys.version_info[:3]
-
-if py_version < (2, 7, 9):
-    raise RuntimeError("This package requres Python 2.7.9+")
-
-packages = ["mygeotab", "mygeotab/ext"]
-if py_version >= (3, 5, 0):
-    packages.append("mygeotab/async")  # Deprecated
-    packages.append("mygeotab/py3")
+packages = ["mygeotab", "mygeotab/ext", "mygeotab/async", "mygeotab/py3"]  # mygeotab/async is deprecated
 
 setup(
     name="mygeotab",
@@ -37,13 +28,22 @@ setup(
     url="https://github.com/geotab/mygeotab-python",
     description="An unofficial Python client for the MyGeotab API",
     long_description=readme + "\n\n" + changelog,
-    extras_require={"notebook": ["pandas"], ":python_version>='3.5'": ["aiohttp", "python-rapidjson"]},
+    extras_require={"notebook": ["pandas>=1.0"]},
     test_suite="tests",
     include_package_data=True,
     packages=packages,
     package_data={"": ["LICENSE"]},
     license="Apache 2.0",
-    install_requires=["requests", "click", "pytz", "arrow", "six"],
+    python_requires=">=3.7",
+    install_requires=[
+        "requests",
+        "urllib3>=2.0",
+        "click",
+        "pytz",
+        "arrow",
+        "aiohttp",
+        "orjson; platform_python_implementation == 'CPython'",
+    ],
     setup_requires=["wheel"],
     entry_points="""
         [console_scripts]
@@ -55,11 +55,8 @@ setup(
         "Natural Language :: English",
         "License :: OSI Approved :: Apache Software License",
         "Programming Language :: Python",
-        "Programming Language :: Python :: 2.7",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.4",
-        "Programming Language :: Python :: 3.5",
-        "Programming Language :: Python :: 3.6",
+        "Programming Language :: Python :: 3 :: Only",
         "Programming Language :: Python :: 3.7",
         "Programming Language :: Python :: Implementation :: PyPy",
         "Topic :: Software Development :: Libraries",
@@ -1,13 +1,59 @@
 # -*- coding: utf-8 -*-
 
+import copy
+import json
 import os
+import pickle
+import shutil
+import ssl
+import subprocess
 import sys
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
 
 import pytest
+import requests_mock
 
 from mygeotab import api
 
 
+@pytest.fixture
+def local_https_server(tmp_path):
+    if not shutil.which("openssl"):
+        pytest.skip("The openssl command is required to create a self-signed certificate")
+    cert_file = str(tmp_path / "cert.pem")
+    key_file = str(tmp_path / "key.pem")
+    subprocess.run(
+        ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1", "-subj", "/CN=localhost"]
+        + ["-addext", "subjectAltName=DNS:localhost", "-keyout", key_file, "-out", cert_file],
+        check=True,
+        capture_output=True,
+    )
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            self.rfile.read(int(self.headers["Content-Length"]))
+            body = b'{"result": "1.0"}'
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert_file, key_file)
+    server.socket = context.wrap_socket(server.socket, server_side=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server.server_address[1], cert_file
+    server.shutdown()
+    server.server_close()
+
+
 class TestAttributes:
     def test_should_verify_ssl(self):
         my_api = api.API("test@example.com", session_id=123, server="my3.geotab.com")
@@ -17,6 +63,323 @@ class TestAttributes:
         my_api = api.API("test@example.com", session_id=123, server="localhost")
         assert my_api._is_verify_ssl is False
 
+    def test_endpoint_follows_server(self):
+        my_api = api.API("test@example.com", session_id=123, server="my3.geotab.com")
+        assert my_api._endpoint == "https://my3.geotab.com/apiv1"
+        my_api.credentials.server = "127.0.0.1"
+        assert my_api._endpoint == "https://127.0.0.1/apiv1"
+        assert my_api._is_verify_ssl is False
+
+
+class TestGetApiUrl:
+    def test_api_url(self):
+        assert api.get_api_url("my3.geotab.com") == "https://my3.geotab.com/apiv1"
+        assert api.get_api_url("https://my3.geotab.com") == "https://my3.geotab.com/apiv1"
+        assert api.get_api_url("https://my3.geotab.com/") == "https://my3.geotab.com/apiv1"
+
+
+class TestSession:
+    def test_session_reused(self):
+        my_api = api.API("test@example.com", session_id=123, server="my3.geotab.com")
+        with requests_mock.mock() as m:
+            m.post("https://my3.geotab.com/apiv1", json=dict(result="1.0.0.0"))
+            my_api.call("GetVersion")
+            my_api.call("GetVersion")
+            assert m.call_count == 2
+        assert my_api._session is not None
+        assert "User-Agent" in my_api._session.headers
+
+    def test_reauthenticate_reuses_session(self, monkeypatch):
+        my_api = api.API("test@example.com", password="abc123", session_id="expired", server="my3.geotab.com")
+        session = my_api._session
+        monkeypatch.setattr(api, "_create_session", lambda: pytest.fail("A new session was created"))
+        invalid_user = dict(error=dict(errors=[dict(name="InvalidUserException", message="Incorrect login")]))
+        credentials = dict(userName="test@example.com", sessionId="renewed", database="testdb")
+        with requests_mock.mock() as m:
+            m.post(
+                "https://my3.geotab.com/apiv1",
+                [
+                    dict(json=invalid_user),
+                    dict(json=dict(result=dict(path="ThisServer", credentials=credentials))),
+                    dict(json=dict(result="1.0.0.0")),
+                ],
+            )
+            assert my_api.call("GetVersion") == "1.0.0.0"
+            assert m.call_count == 3
+        assert my_api._session is session
+        assert my_api.credentials.session_id == "renewed"
+
+    def test_request_body(self):
+        my_api = api.API("test@example.com", session_id=123, server="my3.geotab.com")
+        with requests_mock.mock() as m:
+            m.post("https://my3.geotab.com/apiv1", json=dict(result=[]))
+            my_api.get("Device", name="Test Device")
+            my_api.call("GetVersion")
+            get_body, version_body = [json.loads(request.body) for request in m.request_history]
+        credentials = dict(userName="test@example.com", sessionId=123, database=None)
+        assert get_body == dict(
+            id=-1,
+            method="Get",
+            params=dict(typeName="Device", search=dict(name="Test Device"), resultsLimit=None, credentials=credentials),
+        )
+        assert version_body == dict(id=-1, method="GetVersion", params=dict(credentials=credentials))
+
+    def test_reauthenticate_with_parameters(self):
+        my_api = api.API("test@example.com", password="abc123", session_id="expired", server="my3.geotab.com")
+        invalid_user = dict(error=dict(errors=[dict(name="InvalidUserException", message="Incorrect login")]))
+        credentials = dict(userName="test@example.com", sessionId="renewed", database="testdb")
+        with requests_mock.mock() as m:
+            m.post(
+                "https://my3.geotab.com/apiv1",
+                [
+                    dict(json=invalid_user),
+                    dict(json=dict(result=dict(path="ThisServer", credentials=credentials))),
+                    dict(json=dict(result=[dict(id="b1")])),
+                ],
+            )
+            assert my_api.call("Get", typeName="Device") == [dict(id="b1")]
+            retried_params = m.request_history[2].json()["params"]
+        assert retried_params["typeName"] == "Device"
+        assert retried_params["credentials"]["sessionId"] == "renewed"
+
+    def test_content_types(self):
+        my_api = api.API("test@example.com", session_id=123, server="my3.geotab.com")
+        with requests_mock.mock() as m:
+            m.post(
+                "https://my3.geotab.com/apiv1",
+                text='{"result": "1.0.0.0"}',
+                headers={"Content-Type": "Application/JSON"},
+            )
+            assert my_api.call("GetVersion") == "1.0.0.0"
+            m.post("https://my3.geotab.com/apiv1", text="1.0.0.0", headers={"Content-Type": "text/plain"})
+            assert my_api.call("GetVersion") == "1.0.0.0"
+
+    def test_context_manager_closes_session(self, monkeypatch):
+        closed = []
+        with api.API("test@example.com", session_id=123, server="my3.geotab.com") as my_api:
+            monkeypatch.setattr(my_api._session, "close", lambda: closed.append(True))
+        assert closed == [True]
+
+
+class TestParallelMultiCall:
+    def test_results_in_order(self):
+        my_api = api.API("test@example.com", session_id=123, server="my3.geotab.com")
+        calls = [("Get", dict(typeName="Device", search=dict(id="b{}".format(i)))) for i in range(5)]
+        calls.append(("GetVersion",))
+
+        def respond(request, context):
+            params = request.json()["params"]
+            if "search" in params:
+                return dict(result=[params["search"]])
+            return dict(result="1.0.0.0")
+
+        with requests_mock.mock() as m:
+            m.post("https://my3.geotab.com/apiv1", json=respond)
+            results = my_api.parallel_multi_call(calls, max_workers=3)
+            assert m.call_count == 6
+        assert [result[0]["id"] for result in results[:-1]] == ["b0", "b1", "b2", "b3", "b4"]
+        assert results[-1] == "1.0.0.0"
+
+    def test_chunked(self):
+        my_api = api.API("test@example.com", session_id=123, server="my3.geotab.com")
+        calls = [("Get", dict(typeName="Device", search=dict(id="b{}".format(i)))) for i in range(5)]
+
+        def respond(request, context):
+            return dict(result=[[call["params"]["search"]] for call in request.json()["params"]["calls"]])
+
+        with requests_mock.mock() as m:
+            m.post("https://my3.geotab.com/apiv1", json=respond)
+            results = my_api.parallel_multi_call(calls, chunk_size=2)
+            assert m.call_count == 3
+        assert [result[0]["id"] for result in results] == ["b0", "b1", "b2", "b3", "b4"]
+
+    def test_reauthenticate_once(self, monkeypatch):
+        my_api = api.API("test@example.com", password="abc123", session_id="expired", server="my3.geotab.com")
+        authentications = []
+
+        def authenticate():
+            authentications.append(my_api.credentials.session_id)
+            my_api.credentials = api.Credentials("test@example.com", "renewed", "testdb", "my3.geotab.com")
+
+        monkeypatch.setattr(my_api, "authenticate", authenticate)
+        threads = [threading.Thread(target=my_api._reauthorize, args=("expired",)) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert authentications == ["expired"]
+        assert my_api._reauthorize("expired") is True
+        assert my_api._reauthorize("renewed") is False
+
+    def test_pickle(self):
+        my_api = api.API("test@example.com", password="abc123", session_id="expired", server="my3.geotab.com")
+        for copied_api in (pickle.loads(pickle.dumps(my_api)), copy.deepcopy(my_api)):
+            assert copied_api.credentials.session_id == "expired"
+            assert copied_api._reauthorize("renewed") is True
+
+    def test_max_workers_capped(self, monkeypatch):
+        my_api = api.API("test@example.com", session_id=123, server="my3.geotab.com")
+        worker_counts = []
+
+        class Executor(api.ThreadPoolExecutor):
+            def __init__(self, max_workers):
+                worker_counts.append(max_workers)
+                super(Executor, self).__init__(max_workers)
+
+        monkeypatch.setattr(api, "ThreadPoolExecutor", Executor)
+        with requests_mock.mock() as m:
+            m.post("https://my3.geotab.com/apiv1", json=dict(result="1.0.0.0"))
+            my_api.parallel_multi_call([("GetVersion",)], max_workers=100)
+        assert worker_counts == [api.POOL_MAXSIZE]
+
+
+class TestCache:
+    def test_get_cached(self):
+        my_api = api.API("test@example.com", session_id=123, server="my3.geotab.com", cache={})
+        with requests_mock.mock() as m:
+            m.post("https://my3.geotab.com/apiv1", json=dict(result=[dict(id="b1")]))
+            devices = my_api.get("Device", cache_ttl=60)
+            devices[0]["id"] = "b2"
+            cached_devices = my_api.get("Device", cache_ttl=60)
+            assert m.call_count == 1
+            assert cached_devices[0]["id"] == "b1"
+            my_api.get("Device", cache_ttl=60, name="Test Device")
+            assert m.call_count == 2
+            my_api.call("GetVersion", cache_ttl=60)
+            my_api.call("GetVersion", cache_ttl=60)
+            assert m.call_count == 4
+
+    def test_cache_opt_in(self):
+        my_api = api.API("test@example.com", session_id=123, server="my3.geotab.com", cache={})
+        with requests_mock.mock() as m:
+            m.post("https://my3.geotab.com/apiv1", json=dict(result=[dict(id="b1")]))
+            my_api.get("Device")
+            assert my_api.cache == {}
+            my_api.get("Device", cache_ttl=60)
+            my_api.get("Device")
+            assert m.call_count == 3
+
+    def test_cache_ttl(self):
+        my_api = api.API("test@example.com", session_id=123, server="my3.geotab.com", cache={})
+        with requests_mock.mock() as m:
+            m.post("https://my3.geotab.com/apiv1", json=dict(result=[dict(id="b1")]))
+            my_api.get("Device", cache_ttl=0)
+            my_api.get("Device", cache_ttl=0)
+            assert m.call_count == 2
+            assert len(my_api.cache) == 1
+
+    def test_cache_expire(self):
+        class ExpiringCache(dict):
+            def set(self, key, value, expire=None):
+                self[key] = value
+                self.expire = expire
+
+        my_api = api.API("test@example.com", session_id=123, server="my3.geotab.com", cache=ExpiringCache())
+        with requests_mock.mock() as m:
+            m.post("https://my3.geotab.com/apiv1", json=dict(result=[dict(id="b1")]))
+            my_api.get("Device", cache_ttl=60)
+            assert my_api.cache.expire == 60
+
+    def test_invalidate_while_caching(self):
+        class GrowingCache(dict):
+            def pop(self, key, default=None):
+                self["Device:{}".format(len(self))] = (0, [])
+                return super().pop(key, default)
+
+        my_api = api.API("test@example.com", session_id=123, server="my3.geotab.com", cache=GrowingCache())
+        my_api.cache["User:1"] = (0, [])
+        my_api.cache["User:2"] = (0, [])
+        my_api.invalidate("User")
+        assert not any(key.startswith("User:") for key in my_api.cache)
+
+    def test_invalidate(self):
+        my_api = api.API("test@example.com", session_id=123, server="my3.geotab.com", cache={})
+        with requests_mock.mock() as m:
+            m.post("https://my3.geotab.com/apiv1", json=dict(result=[dict(id="b1")]))
+            my_api.get("Device", cache_ttl=60)
+            my_api.get("User", cache_ttl=60)
+            my_api.invalidate("Device")
+            my_api.get("Device", cache_ttl=60)
+            my_api.get("User", cache_ttl=60)
+            assert m.call_count == 3
+            my_api.set("User", dict(id="b1"))
+            my_api.get("User", cache_ttl=60)
+            assert m.call_count == 5
+
+    def test_invalidated_by_calls(self):
+        my_api = api.API("test@example.com", session_id=123, server="my3.geotab.com", cache={})
+        with requests_mock.mock() as m:
+            m.post("https://my3.geotab.com/apiv1", json=dict(result=[dict(id="b1")]))
+            my_api.get("Device", cache_ttl=60)
+            my_api.get("User", cache_ttl=60)
+            my_api.call("Set", typeName="Device", entity=dict(id="b1"))
+            assert [key.split(":")[0] for key in my_api.cache] == ["User"]
+            my_api.get("Device", cache_ttl=60)
+            my_api.multi_call([("GetVersion",), ("Remove", dict(typeName="User", entity=dict(id="b1")))])
+            assert [key.split(":")[0] for key in my_api.cache] == ["Device"]
+
+    def test_async_cache(self, monkeypatch):
+        api_async = pytest.importorskip("mygeotab.py3.api_async")
+        asyncio = pytest.importorskip("asyncio")
+        queries = []
+
+        async def query(server, method, parameters, timeout=api.DEFAULT_TIMEOUT, verify_ssl=True):
+            queries.append(method)
+            return [dict(id="b1")]
+
+        monkeypatch.setattr(api_async, "_query", query)
+        my_api = api_async.API("test@example.com", session_id=123, server="my3.geotab.com", cache={})
+
+        async def run():
+            await my_api.get_async("Device", cache_ttl=60)
+            await my_api.get_async("Device", cache_ttl=60)
+            await my_api.add_async("Device", dict(name="Test Device"))
+            await my_api.get_async("Device", cache_ttl=60)
+
+        asyncio.run(run())
+        assert queries == ["Get", "Add", "Get"]
+
+
+class TestHTTPAdapter:
+    def test_minimum_tls_version(self):
+        adapter = api.GeotabHTTPAdapter()
+        assert adapter.poolmanager.connection_pool_kw["ssl_minimum_version"] == ssl.TLSVersion.TLSv1_2
+        assert "ssl_version" not in adapter.poolmanager.connection_pool_kw
+
+    def test_async_ssl_context(self):
+        api_async = pytest.importorskip("mygeotab.py3.api_async")
+        context = api_async._create_ssl_context()
+        assert context.minimum_version == ssl.TLSVersion.TLSv1_2
+        assert context.verify_mode == ssl.CERT_REQUIRED
+        assert context.check_hostname is True
+
+    @pytest.mark.filterwarnings("ignore:Unverified HTTPS request")
+    def test_unverified_local_server(self, local_https_server):
+        port, _ = local_https_server
+        with api.API("test@example.com", session_id=123, server="127.0.0.1:{}".format(port)) as my_api:
+            assert my_api._is_verify_ssl is False
+            assert my_api.call("GetVersion") == "1.0"
+
+    def test_verified_server(self, local_https_server):
+        port, cert_file = local_https_server
+        session = api._create_session()
+        server = "https://localhost:{}".format(port)
+        assert api._query(server, "GetVersion", {}, timeout=5, verify_ssl=cert_file, session=session) == "1.0"
+        with pytest.raises(api.requests.exceptions.SSLError):
+            api._query("127.0.0.1:{}".format(port), "GetVersion", {}, timeout=5, verify_ssl=cert_file, session=session)
+        with pytest.raises(api.requests.exceptions.SSLError):
+            api._query(server, "GetVersion", {}, timeout=5, verify_ssl=True, session=session)
+
+    def test_retries(self):
+        my_api = api.API("test@example.com", session_id=123, server="my3.geotab.com")
+        retries = my_api._session.get_adapter("https://my3.geotab.com/apiv1").max_retries
+        assert retries.total == 3
+        assert retries.is_retry("POST", 503)
+        assert not retries.is_retry("POST", 500)
+        assert not retries.is_retry("POST", 502)
+        assert not retries.is_retry("POST", 504)
+        assert retries.read == 0
+
 
 class TestProcessParameters:
     def test_camel_case_transformer(self):
@@ -30,6 +393,29 @@ class TestProcessParameters:
         assert "includeOverlappedTrips" in fixed_params["search"]
         assert fixed_params["search"]["includeOverlappedTrips"]
 
+    def test_parameters_not_mutated(self):
+        params = dict(type_name="Device", search=dict(from_date="2019-01-01"))
+        fixed_params = api.process_parameters(params)
+        assert fixed_params == dict(typeName="Device", search=dict(fromDate="2019-01-01"))
+        assert params == dict(type_name="Device", search=dict(from_date="2019-01-01"))
+
+    def test_camel_case_parameters_unchanged(self):
+        params = dict(typeName="Device", search=dict(fromDate="2019-01-01"), resultsLimit=10)
+        fixed_params = api.process_parameters(params)
+        assert fixed_params == params
+        assert fixed_params["search"] is params["search"]
+
+    def test_deeply_nested_parameters(self):
+        params = dict(search=dict(device_search=dict(group_search=dict(group_id="b1"), id="b2")), from_date=None)
+        fixed_params = api.process_parameters(params)
+        assert fixed_params == dict(
+            search=dict(deviceSearch=dict(groupSearch=dict(groupId="b1"), id="b2")), fromDate=None
+        )
+
+    def test_empty_parameters(self):
+        assert api.process_parameters(None) == {}
+        assert api.process_parameters({}) == {}
+
 
 class TestProcessResults:
     def test_handle_server_exception(self):
@@ -38,32 +424,32 @@ class TestProcessResults:
                 errors=[
                     dict(
                         message=(
-                            u'The method "Get" could not be found. Verify the method name and ensure all method parameters are '
-                            u'included. Request Json: {"params": {"typeName": "Passwords", "credentials": {"userName": '
-                            u'"test@example.com", "sessionId": "12345678901234567890", "database": "my_company"}}, "method": '
-                            u'"Get", "id": -1}'
+                            'The method "Get" could not be found. Verify the method name and ensure all method parameters are '
+                            'included. Request Json: {"params": {"typeName": "Passwords", "credentials": {"userName": '
+                            '"test@example.com", "sessionId": "12345678901234567890", "database": "my_company"}}, "method": '
+                            '"Get", "id": -1}'
                         ),
-                        name=u"MissingMethodException",
+                        name="MissingMethodException",
                         stackTrace=(
-                            u"   at Geotab.Checkmate.Web.APIV1.ProcessRequest(IHttpRequest httpRequest, HttpResponse "
-                            u"httpResponse, String methodName, Dictionary`2 parameters, Action`2 parametersJSONToTokens, "
-                            u"Action`1 handleException, IProfiler profile, Credentials credentials, Int32 requestIndex, "
-                            u"Object requestJsonOrHashMap, Boolean& isAsync) in "
-                            u"c:\\ProgramData\\GEOTAB\\Checkmate\\BuildServer\\master\\WorkingDirectory\\Checkmate\\CheckmateServer\\Geotab\\Checkmate\\Web\\APIV1.cs:line 813\r\n   "
-                            u"at Geotab.Checkmate.Web.APIV1.<>c__DisplayClass13.<ProcessRequest>b__b() "
-                            u"in c:\\ProgramData\\GEOTAB\\Checkmate\\BuildServer\\master\\WorkingDirectory\\Checkmate\\CheckmateServer\\Geotab\\Checkmate\\Web\\APIV1.cs:line 558\r\n   "
-                            u"at Geotab.Checkmate.Web.APIV1.ExecuteHandleException(Action action) in "
-                            u"c:\\ProgramData\\GEOTAB\\Checkmate\\BuildServer\\master\\WorkingDirectory\\Checkmate\\CheckmateServer\\Geotab\\Checkmate\\Web\\APIV1.cs:line 632"
+                            "   at Geotab.Checkmate.Web.APIV1.ProcessRequest(IHttpRequest httpRequest, HttpResponse "
+                            "httpResponse, String methodName, Dictionary`2 parameters, Action`2 parametersJSONToTokens, "
+                            "Action`1 handleException, IProfiler profile, Credentials credentials, Int32 requestIndex, "
+                            "Object requestJsonOrHashMap, Boolean& isAsync) in "
+                            "c:\\ProgramData\\GEOTAB\\Checkmate\\BuildServer\\master\\WorkingDirectory\\Checkmate\\CheckmateServer\\Geotab\\Checkmate\\Web\\APIV1.cs:line 813\r\n   "
+                            "at Geotab.Checkmate.Web.APIV1.<>c__DisplayClass13.<ProcessRequest>b__b() "
+                            "in c:\\ProgramData\\GEOTAB\\Checkmate\\BuildServer\\master\\WorkingDirectory\\Checkmate\\CheckmateServer\\Geotab\\Checkmate\\Web\\APIV1.cs:line 558\r\n   "
+                            "at Geotab.Checkmate.Web.APIV1.ExecuteHandleException(Action action) in "
+                            "c:\\ProgramData\\GEOTAB\\Checkmate\\BuildServer\\master\\WorkingDirectory\\Checkmate\\CheckmateServer\\Geotab\\Checkmate\\Web\\APIV1.cs:line 632"
                         ),
                     )
                 ],
                 message=(
-                    u'The method "Get" could not be found. Verify the method name and ensure all method parameters are '
-                    u'included. Request Json: {"params": {"typeName": "Passwords", "credentials": {"userName": '
-                    u'"test@example.com", "sessionId": "12345678901234567890", "database": "my_company"}}, "method": '
-                    u'"Get", "id": -1}'
+                    'The method "Get" could not be found. Verify the method name and ensure all method parameters are '
+                    'included. Request Json: {"params": {"typeName": "Passwords", "credentials": {"userName": '
+                    '"test@example.com", "sessionId": "12345678901234567890", "database": "my_company"}}, "method": '
+                    '"Get", "id": -1}'
                 ),
-                name=u"JSONRPCError",
+                name="JSONRPCError",
             ),
             requestIndex=0,
         )
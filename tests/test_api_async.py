@@ -4,7 +4,6 @@ import pytest
 
 asyncio = pytest.importorskip("asyncio")
 import os
-import sys
 
 from mygeotab import API, server_call_async
 from mygeotab.exceptions import AuthenticationException, MyGeotabException, TimeoutException
@@ -13,8 +12,6 @@ from tests.test_api_call import USERNAME, PASSWORD, DATABASE, TRAILER_NAME
 USERNAME = os.environ.get("MYGEOTAB_USERNAME_ASYNC", USERNAME)
 PASSWORD = os.environ.get("MYGEOTAB_PASSWORD_ASYNC", PASSWORD)
 
-pytestmark = pytest.mark.skipif(sys.version_info < (3, 5), reason="Only testing API on Python 3.5")
-
 
 @pytest.fixture(scope="session")
 def async_populated_api():
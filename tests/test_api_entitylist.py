@@ -3,7 +3,6 @@
 from datetime import datetime
 
 import pytest
-from six.moves import UserList
 
 from mygeotab.api import EntityList
 
@@ -33,6 +32,15 @@ class TestEntityList:
         assert len(combined_entitylist) == len(entitylist1) + len(entitylist2)
         assert combined_entitylist.type_name == "Device"
 
+    def test_radd_and_mul_entitylist(self):
+        entitylist = get_entitylist()
+        combined_entitylist = [{"id": "b1"}] + entitylist
+        assert len(combined_entitylist) == len(entitylist) + 1
+        assert combined_entitylist.type_name == "Device"
+        multiplied_entitylist = entitylist * 2
+        assert len(multiplied_entitylist) == len(entitylist) * 2
+        assert multiplied_entitylist.type_name == "Device"
+
     def test_sort_id(self):
         entitylist = get_entitylist()
         sorted_by_id = entitylist.sort_by("id")
@@ -57,6 +65,12 @@ class TestEntityList:
         assert sorted_by_id[0]["odometer"] == 3303.0
         assert sorted_by_id[-1]["odometer"] == 20333.0
 
+    def test_sort_empty(self):
+        entitylist = EntityList([], "Device")
+        sorted_by_id = entitylist.sort_by("id")
+        assert len(sorted_by_id) == 0
+        assert sorted_by_id.type_name == "Device"
+
     def test_first_and_last(self):
         entitylist = get_entitylist()
         assert entitylist.first["id"] == "NoDeviceId"
@@ -69,13 +83,23 @@ class TestEntityList:
         sub_entitylist = entitylist[0:1]
         assert sub_entitylist.entity["id"] == "NoDeviceId"
 
+    def test_pretty_limit(self, monkeypatch):
+        pretty = pytest.importorskip("IPython.lib.pretty")
+        entitylist = get_entitylist()
+        assert pretty.pretty(entitylist).count("'id'") == 3
+        monkeypatch.setattr(EntityList, "pretty_limit", 2)
+        pretty_entitylist = pretty.pretty(entitylist)
+        assert pretty_entitylist.startswith("Device([")
+        assert pretty_entitylist.count("'id'") == 2
+        assert "...1 more" in pretty_entitylist
+
     def test_to_dataframe(self):
         entitylist = get_entitylist()
         dataframe = entitylist.to_dataframe()
         assert len(dataframe) == 3
         dataframe = entitylist.to_dataframe(True)
         assert len(dataframe) == 3
-        assert int(dataframe["location.x"][-1:]) == 123
+        assert int(dataframe["location.x"].iloc[-1]) == 123
 
 
 def get_entitylist(type_name="Device", second_device_name="Test Device"):
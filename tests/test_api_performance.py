@@ -1,5 +1,3 @@
-import sys
-
 import requests_mock
 import pytest
 
@@ -17,8 +15,21 @@ def mock_api():
 
 @pytest.mark.skip("Too slow to run automatically")
 class TestApiPerformance:
-    @pytest.mark.skipif(sys.version_info < (3, 5), reason="Requires Python 3.5 or higher")
-    def test_timeout_large_json_rapidjson(self, mock_api, datadir, benchmark):
+    @pytest.mark.skipif(not serializers.use_rapidjson, reason="Requires python-rapidjson")
+    def test_timeout_large_json_rapidjson(self, mock_api, datadir, benchmark, monkeypatch):
+        server = "https://example.com/apiv1"
+        json_response = (datadir / "big_nested_date_response.json").read_text()
+
+        mock_api.timeout = 0.0001
+
+        with requests_mock.mock() as m:
+            m.post(server, text=json_response)
+
+            monkeypatch.setattr(serializers, "use_orjson", False)
+
+            benchmark(mock_api.get, "Data")
+
+    def test_timeout_large_json_orjson(self, mock_api, datadir, benchmark, monkeypatch):
         server = "https://example.com/apiv1"
         json_response = (datadir / "big_nested_date_response.json").read_text()
 
@@ -27,6 +38,8 @@ class TestApiPerformance:
         with requests_mock.mock() as m:
             m.post(server, text=json_response)
 
+            monkeypatch.setattr(serializers, "use_rapidjson", False)
+
             benchmark(mock_api.get, "Data")
 
     def test_timeout_large_json(self, mock_api, datadir, benchmark, monkeypatch):
@@ -38,6 +51,7 @@ class TestApiPerformance:
         with requests_mock.mock() as m:
             m.post(server, text=json_response)
 
+            monkeypatch.setattr(serializers, "use_orjson", False)
             monkeypatch.setattr(serializers, "use_rapidjson", False)
 
             benchmark(mock_api.get, "Data")
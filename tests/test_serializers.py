@@ -3,6 +3,7 @@
 import json
 from datetime import date, datetime
 
+import pytest
 import pytz
 
 from mygeotab import serializers, dates
@@ -42,6 +43,14 @@ class TestSerialization:
         data_str = json_serialize(data)
         assert data_str == expected_str
 
+    def test_non_string_keys(self):
+        assert json_serialize({1: "a"}) == '{"1":"a"}'
+
+    def test_large_integer(self):
+        data = dict(id=1180591620717411303424)
+        assert json_serialize(data) == '{"id":1180591620717411303424}'
+        assert serializers.json_serialize_bytes(data) == b'{"id":1180591620717411303424}'
+
 
 class TestDeserialization:
     def test_top_level_datetime(self):
@@ -91,3 +100,48 @@ class TestDeserialization:
         assert utc_date.year == check_date.year
         assert utc_date.month == check_date.month
         assert utc_date.day == check_date.day
+
+    def test_bytes(self):
+        data_str = b'{"name": "Test \\u00e9", "dateTime": "2015-06-04T07:03:43Z"}'
+        data = json_deserialize(data_str)
+        assert data["name"] == "Test \u00e9"
+        assert data["dateTime"].year == 2015
+
+    def test_datetime_formats(self):
+        data_str = (
+            '{"milliseconds": "2015-06-04T07:03:43.087Z", "ticks": "2015-06-04T07:03:43.1234567Z",'
+            ' "offset": "2015-06-04T07:03:43+05:00", "naive": "2015-06-04T07:03:43"}'
+        )
+        data = json_deserialize(data_str)
+        assert data["milliseconds"] == pytz.utc.localize(datetime(2015, 6, 4, 7, 3, 43, 87000))
+        assert data["ticks"] == pytz.utc.localize(datetime(2015, 6, 4, 7, 3, 43, 123457))
+        assert data["offset"] == pytz.utc.localize(datetime(2015, 6, 4, 2, 3, 43))
+        assert data["naive"] == pytz.utc.localize(datetime(2015, 6, 4, 7, 3, 43))
+
+    def test_nested_lists(self):
+        data = json_deserialize('{"result": [[{"dateTime": "0001-01-01"}], "text"]}')
+        assert data["result"][0][0]["dateTime"].year == 1
+        assert data["result"][1] == "text"
+
+
+class TestStandardLibrarySerialization:
+    @pytest.fixture(autouse=True)
+    def stdlib_json(self, monkeypatch):
+        monkeypatch.setattr(serializers, "use_orjson", False)
+        monkeypatch.setattr(serializers, "use_rapidjson", False)
+
+    def test_top_level_utc_datetime(self):
+        data = dict(dateTime=datetime(2015, 6, 5, 2, 3, 44, 87000))
+        expected_str = '{"dateTime":"2015-06-05T02:03:44.087Z"}'
+        assert json_serialize(data) == expected_str
+        assert serializers.json_serialize_bytes(data) == expected_str.encode("utf-8")
+
+    def test_second_level_datetime(self):
+        data_str = '[{"group": {"dateTime": "2015-06-04T07:03:43Z"}}]'
+        data = json_deserialize(data_str)
+        utc_date = data[0]["group"]["dateTime"]
+        assert utc_date == pytz.utc.localize(datetime(2015, 6, 4, 7, 3, 43))
+
+    def test_bytes(self):
+        data = json_deserialize(b'{"dateTime": "2015-06-04T07:03:43Z"}')
+        assert data["dateTime"] == pytz.utc.localize(datetime(2015, 6, 4, 7, 3, 43))